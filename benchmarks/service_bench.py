@@ -0,0 +1,197 @@
+"""
+Microbenchmarks for SecretService without Redis or Postgres.
+
+Every call builds the DTO and the service the way a request would, so the
+numbers cover pydantic validation, Fernet and dependency wiring.
+
+Usage:
+    python -m benchmarks.service_bench [--sizes 16 1024 1048576] [--min-time 0.5] [--json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+import tracemalloc
+from typing import Awaitable, Callable
+from uuid import uuid4
+
+from cryptography.fernet import Fernet
+
+# Settings objects are instantiated at import time; provide what they require.
+os.environ.setdefault("ENCRYPTION_KEY", Fernet.generate_key().decode())
+os.environ.setdefault("DB_PASSWORD", "benchmark")
+os.environ.setdefault("DB_ECHO_LOG", "False")
+
+# Importing dependencies first resolves the service <-> dependencies import cycle.
+import src.secrets.dependencies  # noqa: E402,F401
+from src.cache.negative_cache import NegativeCache  # noqa: E402
+from src.cache.settings import settings as cache_settings  # noqa: E402
+from src.secrets.dto import SecretCreateDTO, SecretDeleteDTO  # noqa: E402
+from src.secrets.entities import SecretLogEntity  # noqa: E402
+from src.secrets.security import get_fernet  # noqa: E402
+from src.secrets.service import SecretService  # noqa: E402
+
+from tests.fakes import InMemoryCacheClient, InMemorySecretRepository  # noqa: E402
+
+DEFAULT_SIZES = [16, 1024, 64 * 1024, 1024 * 1024, 4 * 1024 * 1024]
+IP_ADDRESS = "127.0.0.1"
+TRACEMALLOC_FILTERS = [tracemalloc.Filter(False, tracemalloc.__file__)]
+
+
+class Harness:
+    """Shared fakes plus a per-call service factory mirroring FastAPI's Depends wiring."""
+
+    def __init__(self):
+        self.cache = InMemoryCacheClient()
+        self.repository = InMemorySecretRepository()
+        self.negative_cache = NegativeCache(
+            max_size=cache_settings.NEGATIVE_CACHE_MAX_SIZE,
+            ttl_seconds=cache_settings.NEGATIVE_CACHE_TTL_SECONDS,
+        )
+
+    def service(self) -> SecretService:
+        return SecretService(self.cache, self.repository, self.negative_cache)
+
+    async def seed(self, payload: str, count: int) -> list[str]:
+        """Store `count` encrypted secrets with create logs, returning their keys."""
+        encrypted = get_fernet().encrypt(payload.encode()).decode()
+        keys = []
+        for _ in range(count):
+            key = str(uuid4())
+            await self.cache.set(key, encrypted)
+            await self.repository.log_action(SecretLogEntity(
+                secret_key=key, action="create", ip_address=IP_ADDRESS, ttl_seconds=3600, passphrase_used=None
+            ))
+            keys.append(key)
+        return keys
+
+
+async def make_create(harness: Harness, payload: str, count: int) -> Callable[[], Awaitable]:
+    async def op():
+        data = SecretCreateDTO(secret=payload)
+        await harness.service().create_secret(data, IP_ADDRESS)
+    return op
+
+
+async def make_get(harness: Harness, payload: str, count: int) -> Callable[[], Awaitable]:
+    keys = iter(await harness.seed(payload, count))
+
+    async def op():
+        await harness.service().get_secret(next(keys), IP_ADDRESS)
+    return op
+
+
+async def make_delete(harness: Harness, payload: str, count: int) -> Callable[[], Awaitable]:
+    keys = iter(await harness.seed(payload, count))
+
+    async def op():
+        data = SecretDeleteDTO()
+        await harness.service().delete_secret(next(keys), data, IP_ADDRESS)
+    return op
+
+
+async def time_op(op: Callable[[], Awaitable], iterations: int) -> float:
+    """Return seconds per call."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await op()
+    return (time.perf_counter() - started) / iterations
+
+
+async def measure_allocations(op: Callable[[], Awaitable], iterations: int) -> tuple[float, float]:
+    """
+    Return per-call averages of:
+        - retained blocks: memory blocks still alive after the call (net, ~0 unless the call keeps data),
+        - peak bytes: high-water mark of memory allocated during the call above the pre-call baseline.
+    """
+    blocks = 0
+    peak = 0
+    tracemalloc.start()
+    try:
+        for _ in range(iterations):
+            before = tracemalloc.take_snapshot()
+            # Reset after the snapshot so its own temporary allocations don't count.
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            await op()
+            _, call_peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot().filter_traces(TRACEMALLOC_FILTERS)
+            before = before.filter_traces(TRACEMALLOC_FILTERS)
+            blocks += sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+            peak += call_peak - baseline
+    finally:
+        tracemalloc.stop()
+    return blocks / iterations, peak / iterations
+
+
+async def calibrate(payload_size: int, min_time: float) -> int:
+    """Pick an iteration count so a create loop runs for at least `min_time` seconds."""
+    harness = Harness()
+    op = await make_create(harness, "x" * payload_size, 0)
+    iterations = 1
+    while True:
+        elapsed = await time_op(op, iterations) * iterations
+        if elapsed >= min_time or iterations >= 100_000:
+            return iterations
+        iterations = min(iterations * 10, max(iterations * 2, int(iterations * min_time / max(elapsed, 1e-9))))
+
+
+async def run(sizes: list[int], min_time: float, alloc_iterations: int) -> list[dict]:
+    results = []
+    for size in sizes:
+        payload = "x" * size
+        iterations = await calibrate(size, min_time)
+        factories = {
+            "create_secret": make_create,
+            "get_secret": make_get,
+            "delete_secret": make_delete,
+        }
+        for name, factory in factories.items():
+            op = await factory(Harness(), payload, iterations)
+            seconds = await time_op(op, iterations)
+
+            op = await factory(Harness(), payload, alloc_iterations)
+            blocks, peak = await measure_allocations(op, alloc_iterations)
+
+            results.append({
+                "operation": name,
+                "payload_bytes": size,
+                "iterations": iterations,
+                "ops_per_sec": 1 / seconds,
+                "us_per_op": seconds * 1e6,
+                "retained_blocks_per_call": blocks,
+                "alloc_peak_bytes_per_call": peak,
+            })
+    return results
+
+
+def print_table(results: list[dict]) -> None:
+    header = f"{'operation':<14} {'payload':>10} {'ops/sec':>12} {'us/op':>10} {'retained blk':>12} {'alloc peak KiB':>14}"
+    print(header)
+    print("-" * len(header))
+    for row in results:
+        print(
+            f"{row['operation']:<14} {row['payload_bytes']:>10} {row['ops_per_sec']:>12.1f} "
+            f"{row['us_per_op']:>10.1f} {row['retained_blocks_per_call']:>12.1f} "
+            f"{row['alloc_peak_bytes_per_call'] / 1024:>14.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Payload sizes in bytes")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Minimum timed seconds per operation")
+    parser.add_argument("--alloc-iterations", type=int, default=5, help="Calls traced for allocation stats")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.sizes, args.min_time, args.alloc_iterations))
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_table(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+import hmac
+from fastapi import Header
+from typing import Annotated
+
+from src.admin.exceptions import InvalidAdminToken
+from src.settings import settings
+
+
+def verify_admin_token(x_admin_token: Annotated[str | None, Header()] = None) -> None:
+    """Require X-Admin-Token to match APP_ADMIN_TOKEN; admin routes stay closed while it is unset."""
+    if not settings.admin_token:
+        raise InvalidAdminToken("Admin access is disabled: APP_ADMIN_TOKEN is not configured")
+    # Compare raw bytes: compare_digest raises TypeError on non-ASCII str. Starlette
+    # decodes headers as latin-1, so encoding back to latin-1 recovers the wire bytes.
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token.encode("latin-1"), settings.admin_token.encode()):
+        raise InvalidAdminToken()
@@ -0,0 +1,5 @@
+from fastapi import HTTPException
+
+class InvalidAdminToken(HTTPException):
+    def __init__(self, detail: str = "Invalid admin token"):
+        super().__init__(status_code=403, detail=detail)
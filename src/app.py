@@ -1,7 +1,9 @@
 from fastapi import FastAPI
 
 from src.cors import init_middleware
+from src.load_shedding.middleware import init_load_shedding
 from src.routes import router
+from src.profiling.router import router as profiling_router
 
 from src.settings import settings
 
@@ -11,7 +13,11 @@ def get_app() -> FastAPI:
                   redoc_url="/redoc" if settings.debug else None,
                   openapi_url="/docs/openapi.json" if settings.debug else None)
 
+    # Added before CORS so shed responses still carry CORS headers.
+    init_load_shedding(app)
     init_middleware(app)
 
     app.include_router(router)
+    if settings.profiling_enabled:
+        app.include_router(profiling_router)
     return app
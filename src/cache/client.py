@@ -3,5 +3,7 @@ from typing import Annotated
 
 from src.cache.redis_client import get_cache_client
 from src.cache.interface import CacheClientInterface
+from src.cache.negative_cache import NegativeCache, get_negative_cache
 
 IClient = Annotated[CacheClientInterface, Depends(get_cache_client)]
+INegativeCache = Annotated[NegativeCache, Depends(get_negative_cache)]
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+class NegativeCacheStatsDTO(BaseModel):
+    size: int
+    hits: int
+    misses: int
+    malformed: int
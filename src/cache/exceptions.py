@@ -2,4 +2,12 @@ from fastapi import HTTPException
 
 class CacheConnectionError(HTTPException):
     def __init__(self, detail: str = "Cache connection failed"):
-        super().__init__(status_code=503, detail=detail)
\ No newline at end of file
+        super().__init__(status_code=503, detail=detail)
+
+class CacheUnavailableError(HTTPException):
+    def __init__(self, detail: str = "Cache temporarily unavailable", retry_after: int = 1):
+        super().__init__(status_code=503, detail=detail, headers={"Retry-After": str(retry_after)})
+
+class CacheTimeoutError(CacheUnavailableError):
+    def __init__(self, detail: str = "Cache operation timed out", retry_after: int = 1):
+        super().__init__(detail=detail, retry_after=retry_after)
@@ -0,0 +1,62 @@
+import time
+from collections import OrderedDict
+
+from src.cache.settings import settings as cache_settings
+
+
+class NegativeCache:
+    """Bounded in-process LRU cache of keys known to be missing, with per-entry TTL."""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self._entries: OrderedDict[str, float] = OrderedDict()
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.malformed = 0
+
+    def contains(self, key: str) -> bool:
+        """Return True if the key is known to be missing, updating hit/miss counters."""
+        expires_at = self._entries.get(key)
+        if expires_at is None:
+            self.misses += 1
+            return False
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return False
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True
+
+    def add(self, key: str) -> None:
+        """Remember a key as missing, evicting the least recently used entry when full."""
+        if self._max_size <= 0:
+            return
+        self._entries[key] = time.monotonic() + self._ttl_seconds
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        """Forget a key, e.g. when it has just been issued."""
+        self._entries.pop(key, None)
+
+    def record_malformed(self) -> None:
+        """Count a lookup rejected for its key format before reaching the cache."""
+        self.malformed += 1
+
+    def stats(self) -> dict[str, int]:
+        """Return current size, hit/miss counters and malformed-key rejections."""
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses, "malformed": self.malformed}
+
+
+_negative_cache = NegativeCache(
+    max_size=cache_settings.NEGATIVE_CACHE_MAX_SIZE,
+    ttl_seconds=cache_settings.NEGATIVE_CACHE_TTL_SECONDS,
+)
+
+
+def get_negative_cache() -> NegativeCache:
+    """FastAPI dependency to provide the per-worker negative lookup cache."""
+    return _negative_cache
@@ -1,11 +1,15 @@
-from typing import Any
+from typing import Any, Awaitable, Callable, TypeVar
+import asyncio
 import json
-from redis.asyncio import Redis
-from redis.exceptions import RedisError
+import random
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.exceptions import ConnectionError as RedisConnectionError, RedisError, TimeoutError as RedisTimeoutError
 from src.cache.settings import settings as redis_settings
-from src.cache.exceptions import CacheConnectionError
+from src.cache.exceptions import CacheConnectionError, CacheTimeoutError, CacheUnavailableError
 from src.cache.interface import CacheClientInterface
 
+T = TypeVar("T")
+
 
 class RedisCacheClient(CacheClientInterface):
     """Redis cache client for storing and retrieving data."""
@@ -13,24 +17,39 @@ class RedisCacheClient(CacheClientInterface):
     def __init__(self, redis_url: str):
         self._client: Redis | None = None
         self._redis_url = redis_url
+        self._connect_lock = asyncio.Lock()
 
     async def connect(self) -> None:
         """Establish connection to Redis."""
         if self._client:
             return
-        try:
-            self._client = Redis.from_url(
-                self._redis_url, encoding="utf-8", decode_responses=True
+        # Concurrent first requests must share one pool rather than each building their own.
+        async with self._connect_lock:
+            if self._client:
+                return
+            pool = BlockingConnectionPool.from_url(
+                self._redis_url,
+                encoding="utf-8",
+                decode_responses=True,
+                max_connections=redis_settings.REDIS_MAX_CONNECTIONS,
+                timeout=redis_settings.REDIS_POOL_TIMEOUT,
+                socket_timeout=redis_settings.REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=redis_settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+                socket_keepalive=redis_settings.REDIS_SOCKET_KEEPALIVE,
+                health_check_interval=redis_settings.REDIS_HEALTH_CHECK_INTERVAL,
             )
-            await self._client.ping()
-        except RedisError as e:
-            self._client = None
-            raise CacheConnectionError("Failed to connect to Redis") from e
+            client = Redis(connection_pool=pool)
+            try:
+                await self._with_retry(client.ping)
+            except (CacheUnavailableError, RedisError) as e:
+                await client.aclose(close_connection_pool=True)
+                raise CacheConnectionError("Failed to connect to Redis") from e
+            self._client = client
 
     async def disconnect(self) -> None:
         """Close Redis connection."""
         if self._client:
-            await self._client.aclose()
+            await self._client.aclose(close_connection_pool=True)
             self._client = None
 
     async def _get_client(self) -> Redis:
@@ -39,63 +58,82 @@ class RedisCacheClient(CacheClientInterface):
             await self.connect()
         return self._client
 
+    async def _with_retry(self, operation: Callable[[], Awaitable[T]]) -> T:
+        """Run an idempotent operation, retrying transient failures with full-jitter exponential backoff."""
+        attempts = max(redis_settings.REDIS_RETRY_ATTEMPTS, 1)
+        for attempt in range(attempts):
+            try:
+                return await operation()
+            except (RedisConnectionError, RedisTimeoutError) as e:
+                if attempt == attempts - 1:
+                    raise self._translate_error(e) from e
+                backoff = min(
+                    redis_settings.REDIS_RETRY_BACKOFF_CAP,
+                    redis_settings.REDIS_RETRY_BACKOFF_BASE * 2 ** attempt,
+                )
+                await asyncio.sleep(random.uniform(0, backoff))
+            except RedisError as e:
+                raise self._translate_error(e) from e
+
+    @staticmethod
+    def _translate_error(error: RedisError) -> CacheUnavailableError:
+        """Map a Redis failure to the error surfaced to callers."""
+        if isinstance(error, RedisTimeoutError):
+            return CacheTimeoutError()
+        return CacheUnavailableError()
+
+    @staticmethod
+    def _deserialize(value: Any | None) -> Any | None:
+        """Decode JSON values, returning plain strings unchanged."""
+        if value is None:
+            return None
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return value
+
     async def get(self, key: str) -> Any | None:
         """Retrieve value by key, deserializing JSON if applicable."""
         if not key:
             return None
         client = await self._get_client()
-        try:
-            value = await client.get(key)
-            if value is None:
-                return None
-            try:
-                return json.loads(value)
-            except json.JSONDecodeError:
-                return value
-        except RedisError:
-            return None
+        value = await self._with_retry(lambda: client.get(key))
+        return self._deserialize(value)
 
     async def set(self, key: str, value: Any, expire: int | None = None) -> None:
         """Store value by key, serializing to JSON if needed."""
         if not key:
             return
         client = await self._get_client()
-        try:
-            if isinstance(value, (dict, list)):
-                value_to_store = json.dumps(value)
-            elif isinstance(value, (str, int, float, bool)):
-                value_to_store = value
-            else:
-                value_to_store = str(value)
-            await client.set(key, value_to_store, ex=expire)
-        except RedisError:
-            pass  # Treat as cache miss
+        if isinstance(value, (dict, list)):
+            value_to_store = json.dumps(value)
+        elif isinstance(value, (str, int, float, bool)):
+            value_to_store = value
+        else:
+            value_to_store = str(value)
+        await self._with_retry(lambda: client.set(key, value_to_store, ex=expire))
 
     async def delete(self, key: str) -> int:
         """Delete a key and return the number of keys deleted."""
         if not key:
             return 0
         client = await self._get_client()
-        try:
-            return await client.delete(key)
-        except RedisError:
-            return 0
+        return await self._with_retry(lambda: client.delete(key))
 
     async def get_and_delete(self, key: str) -> Any | None:
-        """Atomically get and delete a key."""
+        """Atomically get and delete a key.
+
+        GETDEL is not idempotent: a retry after a lost reply would report a
+        consumed secret as missing, so it is attempted exactly once.
+        """
         if not key:
             return None
         client = await self._get_client()
         try:
             value = await client.getdel(key)
-            if value is None:
-                return None
-            try:
-                return json.loads(value)
-            except json.JSONDecodeError:
-                return value
-        except RedisError:
-            return None
+        except RedisError as e:
+            raise self._translate_error(e) from e
+        return self._deserialize(value)
 
 
 _cache_client = RedisCacheClient(str(redis_settings.redis_url))
@@ -105,4 +143,4 @@ def get_cache_client() -> RedisCacheClient:
     """FastAPI dependency to provide Redis cache client."""
     if _cache_client is None:
         raise CacheConnectionError("Redis cache client is not configured")
-    return _cache_client
\ No newline at end of file
+    return _cache_client
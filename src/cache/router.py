@@ -0,0 +1,10 @@
+from fastapi import APIRouter, Depends
+from src.admin.dependencies import verify_admin_token
+from src.cache.client import INegativeCache
+from src.cache.dto import NegativeCacheStatsDTO
+
+router = APIRouter(prefix="/admin/negative-cache", tags=["admin"], dependencies=[Depends(verify_admin_token)])
+
+@router.get("", response_model=NegativeCacheStatsDTO)
+async def get_negative_cache_stats(negative_cache: INegativeCache):
+    return NegativeCacheStatsDTO(**negative_cache.stats())
@@ -7,6 +7,22 @@ class Settings(BaseSettings):
     REDIS_PORT: int = Field(default=6379, alias="REDIS_PORT")
     REDIS_DB: int = Field(default=1, alias="REDIS_DB")
 
+    # --- Connection pool ---
+    REDIS_MAX_CONNECTIONS: int = Field(default=50, alias="REDIS_MAX_CONNECTIONS")
+    REDIS_POOL_TIMEOUT: float = Field(default=1.0, description="Seconds to wait for a free pooled connection", alias="REDIS_POOL_TIMEOUT")
+    REDIS_SOCKET_TIMEOUT: float = Field(default=1.0, alias="REDIS_SOCKET_TIMEOUT")
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = Field(default=1.0, alias="REDIS_SOCKET_CONNECT_TIMEOUT")
+    REDIS_SOCKET_KEEPALIVE: bool = Field(default=True, alias="REDIS_SOCKET_KEEPALIVE")
+    REDIS_HEALTH_CHECK_INTERVAL: int = Field(default=30, alias="REDIS_HEALTH_CHECK_INTERVAL")
+
+    # --- Retries (idempotent operations only) ---
+    REDIS_RETRY_ATTEMPTS: int = Field(default=3, alias="REDIS_RETRY_ATTEMPTS")
+    REDIS_RETRY_BACKOFF_BASE: float = Field(default=0.05, alias="REDIS_RETRY_BACKOFF_BASE")
+    REDIS_RETRY_BACKOFF_CAP: float = Field(default=0.5, alias="REDIS_RETRY_BACKOFF_CAP")
+
+    NEGATIVE_CACHE_MAX_SIZE: int = Field(default=10000, alias="NEGATIVE_CACHE_MAX_SIZE")
+    NEGATIVE_CACHE_TTL_SECONDS: float = Field(default=300, alias="NEGATIVE_CACHE_TTL_SECONDS")
+
 
     @computed_field(return_type=RedisDsn) # type: ignore[misc]
     @property
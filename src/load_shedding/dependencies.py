@@ -0,0 +1,6 @@
+from fastapi import Depends
+from typing import Annotated
+
+from src.load_shedding.limiter import LoadShedder, get_load_shedder
+
+ILoadShedder = Annotated[LoadShedder, Depends(get_load_shedder)]
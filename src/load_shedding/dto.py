@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+class RouteLoadDTO(BaseModel):
+    limit: float
+    in_flight: int
+    queue_depth: int
+    rejected: int
+
+class LoadStatsDTO(BaseModel):
+    routes: dict[str, RouteLoadDTO]
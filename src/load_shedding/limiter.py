@@ -0,0 +1,122 @@
+import asyncio
+from collections import deque
+
+from src.load_shedding.settings import load_shedding_settings
+
+
+class AdaptiveLimiter:
+    """
+    Concurrency limiter with a bounded wait queue and an AIMD-adjusted limit.
+
+    Each completed request nudges the limit up by 1/limit (about +1 per full
+    window) when it finished under the target latency, and multiplies it by
+    the decrease factor when it was slow or failed.
+    """
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        queue_size: int,
+        target_latency: float,
+        decrease_factor: float,
+    ):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.queue_size = queue_size
+        self.target_latency = target_latency
+        self.decrease_factor = decrease_factor
+        self.in_flight = 0
+        self.rejected = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self, timeout: float) -> bool:
+        """
+        Take a slot, waiting in the queue for at most `timeout` seconds.
+
+        Returns:
+            True if admitted, False if the queue is full or the wait timed out.
+        """
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return True
+        if len(self._waiters) >= self.queue_size:
+            self.rejected += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            # A release in the same loop tick may have handed over the slot already.
+            if waiter.done() and not waiter.cancelled():
+                return True
+            self.rejected += 1
+            return False
+        except asyncio.CancelledError:
+            # The slot may have been handed over just before cancellation.
+            if waiter.done() and not waiter.cancelled():
+                self.in_flight -= 1
+                self._wake_waiters()
+            raise
+        finally:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+        return True
+
+    def release(self, latency: float, failed: bool = False) -> None:
+        """Free a slot and adapt the limit from the observed latency."""
+        self.in_flight -= 1
+        if failed or latency > self.target_latency:
+            self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+        else:
+            self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(None)
+
+
+class LoadShedder:
+    """Keeps one AdaptiveLimiter per route, created on first use."""
+
+    def __init__(self):
+        self._limiters: dict[str, AdaptiveLimiter] = {}
+
+    def get_limiter(self, route_key: str) -> AdaptiveLimiter:
+        limiter = self._limiters.get(route_key)
+        if limiter is None:
+            limiter = AdaptiveLimiter(
+                initial_limit=load_shedding_settings.LOAD_SHEDDING_INITIAL_LIMIT,
+                min_limit=load_shedding_settings.LOAD_SHEDDING_MIN_LIMIT,
+                max_limit=load_shedding_settings.LOAD_SHEDDING_MAX_LIMIT,
+                queue_size=load_shedding_settings.LOAD_SHEDDING_QUEUE_SIZE,
+                target_latency=load_shedding_settings.LOAD_SHEDDING_TARGET_LATENCY_SECONDS,
+                decrease_factor=load_shedding_settings.LOAD_SHEDDING_DECREASE_FACTOR,
+            )
+            self._limiters[route_key] = limiter
+        return limiter
+
+    def stats(self) -> dict[str, AdaptiveLimiter]:
+        return dict(self._limiters)
+
+
+_load_shedder = LoadShedder()
+
+
+def get_load_shedder() -> LoadShedder:
+    """FastAPI dependency to provide the per-worker load shedder."""
+    return _load_shedder
@@ -0,0 +1,75 @@
+import time
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.load_shedding.limiter import LoadShedder, get_load_shedder
+from src.load_shedding.settings import load_shedding_settings
+
+
+class LoadSheddingMiddleware:
+    """ASGI middleware applying per-route adaptive concurrency limits."""
+
+    def __init__(self, app: ASGIApp, shedder: LoadShedder):
+        self.app = app
+        self.shedder = shedder
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._is_exempt(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        route_key = self._route_key(scope)
+        if route_key is None:
+            await self.app(scope, receive, send)
+            return
+
+        limiter = self.shedder.get_limiter(route_key)
+        if not await limiter.acquire(load_shedding_settings.LOAD_SHEDDING_QUEUE_TIMEOUT_SECONDS):
+            response = JSONResponse(
+                {"detail": "Service overloaded"},
+                status_code=503,
+                headers={"Retry-After": str(load_shedding_settings.LOAD_SHEDDING_RETRY_AFTER_SECONDS)},
+            )
+            await response(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            limiter.release(time.perf_counter() - started, failed=status_code >= 500)
+
+    @staticmethod
+    def _is_exempt(path: str) -> bool:
+        """Match exempt paths exactly or as a parent segment, never as a bare string prefix."""
+        for exempt in load_shedding_settings.LOAD_SHEDDING_EXEMPT_PATHS:
+            exempt = exempt.rstrip("/")
+            if path == exempt or path.startswith(exempt + "/"):
+                return True
+        return False
+
+    @staticmethod
+    def _route_key(scope: Scope) -> str | None:
+        """Return "METHOD /path/{template}" for the matching route, or None if nothing matches."""
+        for route in scope["app"].router.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return f"{scope['method']} {route.path}"
+        return None
+
+
+def init_load_shedding(app: FastAPI):
+    if not load_shedding_settings.LOAD_SHEDDING_ENABLED:
+        return
+    app.add_middleware(LoadSheddingMiddleware, shedder=get_load_shedder())
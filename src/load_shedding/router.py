@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends
+from src.admin.dependencies import verify_admin_token
+from src.load_shedding.dependencies import ILoadShedder
+from src.load_shedding.dto import LoadStatsDTO, RouteLoadDTO
+
+router = APIRouter(prefix="/admin/load", tags=["admin"], dependencies=[Depends(verify_admin_token)])
+
+@router.get("", response_model=LoadStatsDTO)
+async def get_load(shedder: ILoadShedder):
+    return LoadStatsDTO(routes={
+        route_key: RouteLoadDTO(
+            limit=limiter.limit,
+            in_flight=limiter.in_flight,
+            queue_depth=limiter.queue_depth,
+            rejected=limiter.rejected,
+        )
+        for route_key, limiter in shedder.stats().items()
+    })
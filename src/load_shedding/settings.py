@@ -0,0 +1,19 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class LoadSheddingConfig(BaseSettings):
+    LOAD_SHEDDING_ENABLED: bool = Field(True, alias="LOAD_SHEDDING_ENABLED")
+    LOAD_SHEDDING_INITIAL_LIMIT: int = Field(20, alias="LOAD_SHEDDING_INITIAL_LIMIT")
+    LOAD_SHEDDING_MIN_LIMIT: int = Field(2, alias="LOAD_SHEDDING_MIN_LIMIT")
+    LOAD_SHEDDING_MAX_LIMIT: int = Field(200, alias="LOAD_SHEDDING_MAX_LIMIT")
+    LOAD_SHEDDING_QUEUE_SIZE: int = Field(50, description="Requests allowed to wait per route", alias="LOAD_SHEDDING_QUEUE_SIZE")
+    LOAD_SHEDDING_QUEUE_TIMEOUT_SECONDS: float = Field(1.0, alias="LOAD_SHEDDING_QUEUE_TIMEOUT_SECONDS")
+    LOAD_SHEDDING_TARGET_LATENCY_SECONDS: float = Field(0.25, description="Latency above which the limit is decreased", alias="LOAD_SHEDDING_TARGET_LATENCY_SECONDS")
+    LOAD_SHEDDING_DECREASE_FACTOR: float = Field(0.9, alias="LOAD_SHEDDING_DECREASE_FACTOR")
+    LOAD_SHEDDING_RETRY_AFTER_SECONDS: int = Field(1, alias="LOAD_SHEDDING_RETRY_AFTER_SECONDS")
+    # Exact paths, also covering everything below them ("/v1/admin" exempts "/v1/admin/profile")
+    LOAD_SHEDDING_EXEMPT_PATHS: list[str] = Field(["/v1/admin"], alias="LOAD_SHEDDING_EXEMPT_PATHS")
+
+
+load_shedding_settings = LoadSheddingConfig()
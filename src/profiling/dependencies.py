@@ -0,0 +1,6 @@
+from fastapi import Depends
+from typing import Annotated
+
+from src.profiling.sampler import SamplingProfiler, get_profiler
+
+IProfiler = Annotated[SamplingProfiler, Depends(get_profiler)]
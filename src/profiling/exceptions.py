@@ -0,0 +1,5 @@
+from fastapi import HTTPException
+
+class ProfilerBusy(HTTPException):
+    def __init__(self):
+        super().__init__(status_code=409, detail="Profiler is already running on this worker")
@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import PlainTextResponse
+from src.admin.dependencies import verify_admin_token
+from src.profiling.dependencies import IProfiler
+from src.profiling.sampler import to_collapsed
+
+router = APIRouter(prefix="/v1/admin", tags=["admin"], dependencies=[Depends(verify_admin_token)])
+
+@router.get("/profile", response_class=PlainTextResponse)
+async def profile(
+    profiler: IProfiler,
+    seconds: float = Query(default=10, gt=0, le=120),
+    hz: int = Query(default=100, ge=1, le=1000),
+):
+    samples = await profiler.profile(seconds, 1 / hz)
+    return PlainTextResponse(to_collapsed(samples), headers={"Cache-Control": "no-store"})
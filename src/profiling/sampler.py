@@ -0,0 +1,81 @@
+import asyncio
+import sys
+import threading
+from collections import Counter
+
+from src.profiling.exceptions import ProfilerBusy
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler for the event loop thread of the current worker.
+
+    A daemon thread snapshots the loop thread's Python stack every `interval`
+    seconds via sys._current_frames(); nothing is hooked into the interpreter,
+    so overhead is one stack walk per sample. The sampler needs the GIL to
+    take a sample, so CPU bursts shorter than sys.getswitchinterval() tend to
+    be attributed to the loop's next GIL release (usually select).
+    """
+    def __init__(self):
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    async def profile(self, seconds: float, interval: float) -> Counter[str]:
+        """
+        Sample the calling event loop's thread for `seconds`.
+
+        Returns:
+            Counter mapping collapsed stacks ("outer;...;inner") to sample counts.
+
+        Raises:
+            ProfilerBusy: If a profile is already being collected on this worker.
+        """
+        if self._running:
+            raise ProfilerBusy()
+        self._running = True
+
+        samples: Counter[str] = Counter()
+        stop = threading.Event()
+        sampler = threading.Thread(
+            target=self._sample,
+            args=(threading.get_ident(), interval, stop, samples),
+            name="sampling-profiler",
+            daemon=True,
+        )
+        sampler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            stop.set()
+            await asyncio.to_thread(sampler.join)
+            self._running = False
+        return samples
+
+    @staticmethod
+    def _sample(thread_id: int, interval: float, stop: threading.Event, samples: Counter[str]) -> None:
+        while not stop.wait(interval):
+            frame = sys._current_frames().get(thread_id)
+            if frame is None:
+                return
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                frame = frame.f_back
+            samples[";".join(reversed(stack))] += 1
+
+
+def to_collapsed(samples: Counter[str]) -> str:
+    """Render samples in the collapsed-stack format read by flamegraph.pl and speedscope."""
+    return "\n".join(f"{stack} {count}" for stack, count in samples.most_common())
+
+
+_profiler = SamplingProfiler()
+
+
+def get_profiler() -> SamplingProfiler:
+    """FastAPI dependency to provide the per-worker sampling profiler."""
+    return _profiler
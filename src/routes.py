@@ -1,6 +1,10 @@
 from fastapi import APIRouter
 from src.secrets.router import router as secrets_router
+from src.load_shedding.router import router as load_router
+from src.cache.router import router as negative_cache_router
 
 router = APIRouter(prefix="/v1", tags=["v1"])
 
-router.include_router(secrets_router)
\ No newline at end of file
+router.include_router(secrets_router)
+router.include_router(load_router)
+router.include_router(negative_cache_router)
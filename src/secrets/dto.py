@@ -23,5 +23,5 @@ class SecretLogDTO(BaseModel):
     secret_key: str
     action: str
     ip_address: str
-    ttl_seconds: int
-    passphrase_used: str
\ No newline at end of file
+    ttl_seconds: int | None = None
+    passphrase_used: str | None = None
\ No newline at end of file
@@ -28,6 +28,8 @@ class SecretRepository:
         )
         result = await self.session.execute(query)
         instance = result.scalar_one_or_none()
+        if instance is None:
+            return None
         return await self._get_dto(instance)
 
     async def _get_dto(self, row: SecretLogModel) -> SecretLogDTO:
@@ -1,16 +1,22 @@
+import asyncio
+import logging
 from uuid import uuid4
-from src.cache.client import IClient
+from src.cache.client import IClient, INegativeCache
 from src.secrets.entities import SecretEntity, SecretLogEntity
 from src.secrets.dependencies import ISecretRepository
 from src.secrets.settings import secrets_settings
 from src.secrets.exceptions import SecretNotFound, InvalidPassphrase
 from src.secrets.dto import SecretCreateDTO, SecretDeleteDTO
 from src.secrets.security import get_fernet
+from src.secrets.validators import is_valid_secret_key
+
+logger = logging.getLogger(__name__)
 
 class SecretService:
-    def __init__(self, cache_client: IClient, repository: ISecretRepository):
+    def __init__(self, cache_client: IClient, repository: ISecretRepository, negative_cache: INegativeCache):
         self.cache_client = cache_client
         self.repository = repository
+        self.negative_cache = negative_cache
 
     async def create_secret(self, secret_data: SecretCreateDTO, ip_address: str) -> SecretEntity:
         """Create a new secret and log the action."""
@@ -25,7 +31,7 @@ class SecretService:
             passphrase=secret_data.passphrase,
             ttl_seconds=ttl
         )
-        await self.cache_client.set(str(secret.key), secret.value, expire=ttl)
+        self.negative_cache.discard(str(secret.key))
 
         log = SecretLogEntity(
             secret_key=str(secret.key),
@@ -34,14 +40,16 @@ class SecretService:
             ttl_seconds=ttl,
             passphrase_used=secret.passphrase
         )
-        await self.repository.log_action(log)
+        if secrets_settings.CONCURRENT_CREATE:
+            await self._write_concurrently(secret, log)
+        else:
+            await self.cache_client.set(str(secret.key), secret.value, expire=ttl)
+            await self.repository.log_action(log)
         return secret
 
     async def get_secret(self, secret_key: str, ip_address: str) -> str:
         """Retrieve and delete a secret, logging the action."""
-        encrypted_secret = await self.cache_client.get_and_delete(secret_key)
-        if not encrypted_secret:
-            raise SecretNotFound()
+        encrypted_secret = await self._consume(secret_key)
 
         fernet = get_fernet()
         secret_value = fernet.decrypt(encrypted_secret.encode()).decode()
@@ -58,9 +66,7 @@ class SecretService:
 
     async def delete_secret(self, secret_key: str, delete_data: SecretDeleteDTO, ip_address: str) -> None:
         """Delete a secret with passphrase validation, logging the action."""
-        encrypted_secret = await self.cache_client.get_and_delete(secret_key)
-        if not encrypted_secret:
-            raise SecretNotFound()
+        encrypted_secret = await self._consume(secret_key)
 
         create_log = await self.repository.get_create_log(secret_key)
         if create_log and create_log.passphrase_used and create_log.passphrase_used != delete_data.passphrase:
@@ -73,4 +79,57 @@ class SecretService:
             passphrase_used=delete_data.passphrase,
             ttl_seconds=None,
         )
-        await self.repository.log_action(log)
\ No newline at end of file
+        await self.repository.log_action(log)
+
+    async def _write_concurrently(self, secret: SecretEntity, log: SecretLogEntity) -> None:
+        """Issue the cache write and the audit write in parallel; on any failure remove the cached secret and record what happened."""
+        cache_result, log_result = await asyncio.gather(
+            self.cache_client.set(str(secret.key), secret.value, expire=secret.ttl_seconds),
+            self.repository.log_action(log),
+            return_exceptions=True,
+        )
+        cache_failed = isinstance(cache_result, BaseException)
+        log_failed = isinstance(log_result, BaseException)
+
+        if not cache_failed and not log_failed:
+            return
+
+        # Remove the secret whenever either write failed: a SET that timed out may still have stored it.
+        try:
+            await self.cache_client.delete(str(secret.key))
+        except Exception:
+            logger.exception("Failed to remove secret %s after a failed create; it may stay readable until its TTL expires", secret.key)
+
+        if log_failed:
+            if cache_failed:
+                logger.error("Create log for secret %s failed", secret.key, exc_info=log_result)
+                raise cache_result
+            raise log_result
+
+        try:
+            await self.repository.log_action(SecretLogEntity(
+                secret_key=log.secret_key,
+                action="create_failed",
+                ip_address=log.ip_address,
+                ttl_seconds=log.ttl_seconds,
+                passphrase_used=None
+            ))
+        except Exception:
+            logger.exception("Failed to record create_failed log for secret %s", secret.key)
+        raise cache_result
+
+    async def _consume(self, secret_key: str) -> str:
+        """Atomically fetch and remove a secret, rejecting malformed and known-missing keys without I/O."""
+        if not is_valid_secret_key(secret_key):
+            self.negative_cache.record_malformed()
+            raise SecretNotFound()
+        if self.negative_cache.contains(secret_key):
+            raise SecretNotFound()
+
+        # A cache failure raises here, so the key is only remembered after a definitive answer.
+        encrypted_secret = await self.cache_client.get_and_delete(secret_key)
+        # Keys are single-use: once consumed or missing they never come back.
+        self.negative_cache.add(secret_key)
+        if not encrypted_secret:
+            raise SecretNotFound()
+        return encrypted_secret
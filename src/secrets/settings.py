@@ -4,5 +4,6 @@ from pydantic_settings import BaseSettings
 class SecretsConfig(BaseSettings):
     MIN_TTL_SECONDS: int = Field(300, alias="MIN_TTL_SECONDS")  # Minimum TTL of 5 minutes
     ENCRYPTION_KEY: str = Field(..., alias="ENCRYPTION_KEY")
+    CONCURRENT_CREATE: bool = Field(False, alias="CONCURRENT_CREATE")  # Write cache and audit log in parallel
 
 secrets_settings = SecretsConfig()
\ No newline at end of file
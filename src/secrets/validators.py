@@ -0,0 +1,11 @@
+import re
+
+# Secret keys are issued as str(uuid4()): lowercase, hyphenated, version 4, RFC 4122 variant.
+SECRET_KEY_PATTERN = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$"
+)
+
+
+def is_valid_secret_key(secret_key: str) -> bool:
+    """Check that a key matches the format issued by create_secret."""
+    return SECRET_KEY_PATTERN.fullmatch(secret_key) is not None
@@ -6,6 +6,8 @@ class Settings(BaseSettings):
     host: str = Field(alias="APP_HOST")
     port: int = Field(alias="APP_PORT")
     debug: bool = Field(default=False, alias="APP_DEBUG")
+    profiling_enabled: bool = Field(default=False, alias="APP_PROFILING_ENABLED")
+    admin_token: str | None = Field(default=None, alias="APP_ADMIN_TOKEN")
 
 
 
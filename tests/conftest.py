@@ -0,0 +1,42 @@
+import os
+
+import pytest
+
+# Settings objects are instantiated at import time; provide what they require.
+os.environ.setdefault("ENCRYPTION_KEY", "CjuJfV0i_htlu4jLVAKjM6BcoILi2hDnypJgOJ0FiLI=")
+os.environ.setdefault("DB_PASSWORD", "postgres")
+os.environ.setdefault("DB_ECHO_LOG", "False")
+os.environ.setdefault("APP_HOST", "127.0.0.1")
+os.environ.setdefault("APP_PORT", "8000")
+
+# Importing dependencies first resolves the service <-> dependencies import cycle.
+import src.secrets.dependencies  # noqa: E402,F401
+
+from tests.fakes import InMemoryCacheClient, InMemorySecretRepository  # noqa: E402
+from src.cache.negative_cache import NegativeCache  # noqa: E402
+from src.secrets.service import SecretService  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def cache():
+    return InMemoryCacheClient()
+
+
+@pytest.fixture
+def repository():
+    return InMemorySecretRepository()
+
+
+@pytest.fixture
+def negative_cache():
+    return NegativeCache(max_size=100, ttl_seconds=60)
+
+
+@pytest.fixture
+def service(cache, repository, negative_cache):
+    return SecretService(cache, repository, negative_cache)
@@ -0,0 +1,58 @@
+"""In-memory stand-ins for the Redis cache and the Postgres repository."""
+import itertools
+from typing import Any, Optional
+
+from src.cache.interface import CacheClientInterface
+from src.secrets.dto import SecretLogDTO
+from src.secrets.entities import SecretLogEntity
+
+
+class InMemoryCacheClient(CacheClientInterface):
+    """Dict-backed cache client; expiry is ignored."""
+
+    def __init__(self):
+        self._data: dict[str, Any] = {}
+
+    async def get(self, key: str) -> Any | None:
+        return self._data.get(key)
+
+    async def set(self, key: str, value: Any, expire: int | None = None) -> None:
+        self._data[key] = value
+
+    async def delete(self, key: str) -> int:
+        return 1 if self._data.pop(key, None) is not None else 0
+
+    async def get_and_delete(self, key: str) -> Any | None:
+        return self._data.pop(key, None)
+
+    async def connect(self) -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        pass
+
+
+class InMemorySecretRepository:
+    """Mirrors SecretRepository's public methods on top of a list."""
+
+    def __init__(self):
+        self._ids = itertools.count(1)
+        self._create_logs: dict[str, SecretLogDTO] = {}
+        self.logs: list[SecretLogDTO] = []
+
+    async def log_action(self, log: SecretLogEntity) -> SecretLogDTO:
+        dto = SecretLogDTO(
+            id=next(self._ids),
+            secret_key=log.secret_key,
+            action=log.action,
+            ip_address=log.ip_address,
+            ttl_seconds=log.ttl_seconds,
+            passphrase_used=log.passphrase_used,
+        )
+        self.logs.append(dto)
+        if log.action == "create":
+            self._create_logs[log.secret_key] = dto
+        return dto
+
+    async def get_create_log(self, secret_key: str) -> Optional[SecretLogDTO]:
+        return self._create_logs.get(secret_key)
@@ -0,0 +1,86 @@
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.app import get_app
+from src.settings import settings
+
+PROFILE_URL = "/v1/admin/profile?seconds=0.05&hz=200"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(settings, "profiling_enabled", True)
+    return TestClient(get_app())
+
+
+def test_admin_routes_closed_without_configured_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "admin_token", None)
+
+    response = client.get(PROFILE_URL, headers={"X-Admin-Token": ""})
+
+    assert response.status_code == 403
+
+
+def test_admin_routes_reject_wrong_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "admin_token", "secret")
+
+    assert client.get(PROFILE_URL).status_code == 403
+    assert client.get(PROFILE_URL, headers={"X-Admin-Token": "wrong"}).status_code == 403
+
+
+def test_profile_returns_collapsed_stacks(client, monkeypatch):
+    monkeypatch.setattr(settings, "admin_token", "secret")
+
+    response = client.get(PROFILE_URL, headers={"X-Admin-Token": "secret"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    lines = response.text.splitlines()
+    assert lines
+    assert all(re.match(r"^\S.*\S \d+$", line) for line in lines)
+
+
+def test_profile_route_absent_when_disabled(monkeypatch):
+    monkeypatch.setattr(settings, "profiling_enabled", False)
+    monkeypatch.setattr(settings, "admin_token", "secret")
+
+    response = TestClient(get_app()).get(PROFILE_URL, headers={"X-Admin-Token": "secret"})
+
+    assert response.status_code == 404
+
+
+def test_load_stats_require_admin_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "admin_token", "secret")
+
+    assert client.get("/v1/admin/load").status_code == 403
+    response = client.get("/v1/admin/load", headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 200
+    assert "routes" in response.json()
+
+
+def test_negative_cache_stats_require_admin_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "admin_token", "secret")
+
+    assert client.get("/v1/admin/negative-cache").status_code == 403
+    response = client.get("/v1/admin/negative-cache", headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 200
+    assert set(response.json()) == {"size", "hits", "misses", "malformed"}
+
+
+@pytest.mark.parametrize("admin_token", ["secret", "café"])
+def test_non_ascii_token_header_is_rejected_not_crashing(client, monkeypatch, admin_token):
+    monkeypatch.setattr(settings, "admin_token", admin_token)
+
+    response = client.get("/v1/admin/load", headers={"X-Admin-Token": "cafè".encode("latin-1")})
+
+    assert response.status_code == 403
+
+
+def test_non_ascii_admin_token_is_accepted(client, monkeypatch):
+    monkeypatch.setattr(settings, "admin_token", "café")
+
+    response = client.get("/v1/admin/load", headers={"X-Admin-Token": "café".encode()})
+
+    assert response.status_code == 200
@@ -0,0 +1,124 @@
+import logging
+
+import pytest
+
+from tests.fakes import InMemoryCacheClient, InMemorySecretRepository
+from src.cache.exceptions import CacheTimeoutError, CacheUnavailableError
+from src.secrets.dto import SecretCreateDTO
+from src.secrets.service import SecretService
+from src.secrets.settings import secrets_settings
+
+pytestmark = pytest.mark.anyio
+
+IP_ADDRESS = "127.0.0.1"
+
+
+class AuditWriteFailed(Exception):
+    pass
+
+
+class FailingCacheClient(InMemoryCacheClient):
+    def __init__(self, set_error: Exception | None = None, store_before_failing: bool = False, fail_delete: bool = False):
+        super().__init__()
+        self.set_error = set_error
+        self.store_before_failing = store_before_failing
+        self.fail_delete = fail_delete
+
+    async def set(self, key, value, expire=None):
+        if self.set_error is None or self.store_before_failing:
+            await super().set(key, value, expire)
+        if self.set_error is not None:
+            raise self.set_error
+
+    async def delete(self, key):
+        if self.fail_delete:
+            raise CacheUnavailableError()
+        return await super().delete(key)
+
+
+class FailingRepository(InMemorySecretRepository):
+    def __init__(self, fail_actions: tuple[str, ...] = ()):
+        super().__init__()
+        self.fail_actions = fail_actions
+
+    async def log_action(self, log):
+        if log.action in self.fail_actions:
+            raise AuditWriteFailed(log.action)
+        return await super().log_action(log)
+
+
+@pytest.fixture(autouse=True)
+def concurrent_create(monkeypatch):
+    monkeypatch.setattr(secrets_settings, "CONCURRENT_CREATE", True)
+
+
+async def test_both_writes_succeed(negative_cache):
+    cache, repository = FailingCacheClient(), FailingRepository()
+
+    secret = await SecretService(cache, repository, negative_cache).create_secret(SecretCreateDTO(secret="s"), IP_ADDRESS)
+
+    assert await cache.get(str(secret.key)) == secret.value
+    assert [log.action for log in repository.logs] == ["create"]
+
+
+async def test_audit_failure_removes_cached_secret(negative_cache):
+    cache, repository = FailingCacheClient(), FailingRepository(fail_actions=("create",))
+
+    with pytest.raises(AuditWriteFailed):
+        await SecretService(cache, repository, negative_cache).create_secret(SecretCreateDTO(secret="s"), IP_ADDRESS)
+
+    assert cache._data == {}
+
+
+async def test_audit_failure_with_failed_compensation_keeps_original_error(negative_cache, caplog):
+    cache, repository = FailingCacheClient(fail_delete=True), FailingRepository(fail_actions=("create",))
+
+    with caplog.at_level(logging.ERROR, logger="src.secrets.service"):
+        with pytest.raises(AuditWriteFailed):
+            await SecretService(cache, repository, negative_cache).create_secret(SecretCreateDTO(secret="s"), IP_ADDRESS)
+
+    assert "Failed to remove secret" in caplog.text
+
+
+async def test_cache_failure_records_failed_create(negative_cache):
+    cache, repository = FailingCacheClient(set_error=CacheUnavailableError()), FailingRepository()
+
+    with pytest.raises(CacheUnavailableError):
+        await SecretService(cache, repository, negative_cache).create_secret(SecretCreateDTO(secret="s"), IP_ADDRESS)
+
+    assert [log.action for log in repository.logs] == ["create", "create_failed"]
+
+
+async def test_cache_timeout_removes_possibly_stored_secret(negative_cache):
+    cache = FailingCacheClient(set_error=CacheTimeoutError(), store_before_failing=True)
+    repository = FailingRepository()
+
+    with pytest.raises(CacheTimeoutError):
+        await SecretService(cache, repository, negative_cache).create_secret(SecretCreateDTO(secret="s"), IP_ADDRESS)
+
+    assert cache._data == {}
+    assert [log.action for log in repository.logs] == ["create", "create_failed"]
+
+
+async def test_cache_failure_with_failed_compensation_keeps_original_error(negative_cache, caplog):
+    cache = FailingCacheClient(set_error=CacheUnavailableError())
+    repository = FailingRepository(fail_actions=("create_failed",))
+
+    with caplog.at_level(logging.ERROR, logger="src.secrets.service"):
+        with pytest.raises(CacheUnavailableError):
+            await SecretService(cache, repository, negative_cache).create_secret(SecretCreateDTO(secret="s"), IP_ADDRESS)
+
+    assert "create_failed" in caplog.text
+
+
+async def test_both_writes_fail_logs_audit_error(negative_cache, caplog):
+    cache = FailingCacheClient(set_error=CacheTimeoutError(), store_before_failing=True)
+    repository = FailingRepository(fail_actions=("create",))
+
+    with caplog.at_level(logging.ERROR, logger="src.secrets.service"):
+        with pytest.raises(CacheTimeoutError):
+            await SecretService(cache, repository, negative_cache).create_secret(SecretCreateDTO(secret="s"), IP_ADDRESS)
+
+    assert cache._data == {}
+    assert repository.logs == []
+    assert "AuditWriteFailed" in caplog.text
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from src.load_shedding import limiter as limiter_module
+from src.load_shedding.limiter import AdaptiveLimiter
+
+pytestmark = pytest.mark.anyio
+
+
+def make_limiter(**overrides) -> AdaptiveLimiter:
+    options = dict(
+        initial_limit=1, min_limit=1, max_limit=10, queue_size=1, target_latency=0.1, decrease_factor=0.5
+    )
+    options.update(overrides)
+    return AdaptiveLimiter(**options)
+
+
+async def test_admits_up_to_limit_then_queues_and_sheds():
+    limiter = make_limiter()
+    assert await limiter.acquire(timeout=1)
+
+    queued = asyncio.create_task(limiter.acquire(timeout=1))
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 1
+    assert not await limiter.acquire(timeout=1)
+    assert limiter.rejected == 1
+
+    limiter.release(latency=0.01)
+    assert await queued
+    assert limiter.in_flight == 1
+    assert limiter.queue_depth == 0
+
+
+async def test_queue_timeout_rejects_without_leaking_slot():
+    limiter = make_limiter()
+    assert await limiter.acquire(timeout=1)
+
+    assert not await limiter.acquire(timeout=0.01)
+    assert limiter.in_flight == 1
+    assert limiter.queue_depth == 0
+
+
+async def test_slot_handed_over_at_timeout_is_kept(monkeypatch):
+    limiter = make_limiter()
+    assert await limiter.acquire(timeout=1)
+
+    async def wait_for_racing_release(waiter, timeout):
+        # The slot is handed over in the same tick the wait times out.
+        limiter.release(latency=0.01)
+        assert waiter.done()
+        raise asyncio.TimeoutError
+
+    monkeypatch.setattr(limiter_module.asyncio, "wait_for", wait_for_racing_release)
+    assert await limiter.acquire(timeout=0.01)
+    assert limiter.in_flight == 1
+    assert limiter.rejected == 0
+
+    limiter.release(latency=0.01)
+    assert limiter.in_flight == 0
+
+
+async def test_limit_adapts_to_latency():
+    limiter = make_limiter(initial_limit=4)
+    await limiter.acquire(timeout=1)
+    limiter.release(latency=0.01)
+    assert limiter.limit == pytest.approx(4.25)
+
+    await limiter.acquire(timeout=1)
+    limiter.release(latency=1.0)
+    assert limiter.limit == pytest.approx(2.125)
+
+    await limiter.acquire(timeout=1)
+    limiter.release(latency=0.01, failed=True)
+    assert limiter.limit == pytest.approx(1.0625)
@@ -0,0 +1,15 @@
+import pytest
+
+from src.load_shedding.middleware import LoadSheddingMiddleware
+
+
+@pytest.mark.parametrize("path, exempt", [
+    ("/v1/admin", True),
+    ("/v1/admin/", True),
+    ("/v1/admin/load", True),
+    ("/v1/admin-x", False),
+    ("/v1/adminanything", False),
+    ("/v1/secrets/secret", False),
+])
+def test_exempt_paths_match_whole_segments(path, exempt):
+    assert LoadSheddingMiddleware._is_exempt(path) is exempt
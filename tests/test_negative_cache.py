@@ -0,0 +1,55 @@
+from src.cache import negative_cache as negative_cache_module
+from src.cache.negative_cache import NegativeCache
+
+
+def test_contains_counts_hits_and_misses():
+    cache = NegativeCache(max_size=10, ttl_seconds=60)
+
+    assert not cache.contains("a")
+    cache.add("a")
+    assert cache.contains("a")
+
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 1, "malformed": 0}
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(negative_cache_module.time, "monotonic", lambda: now[0])
+    cache = NegativeCache(max_size=10, ttl_seconds=5)
+
+    cache.add("a")
+    now[0] += 4
+    assert cache.contains("a")
+    now[0] += 2
+    assert not cache.contains("a")
+    assert cache.stats()["size"] == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = NegativeCache(max_size=2, ttl_seconds=60)
+    cache.add("a")
+    cache.add("b")
+    assert cache.contains("a")
+
+    cache.add("c")
+
+    assert cache.contains("a")
+    assert not cache.contains("b")
+    assert cache.contains("c")
+
+
+def test_discard_and_zero_size():
+    cache = NegativeCache(max_size=10, ttl_seconds=60)
+    cache.add("a")
+    cache.discard("a")
+    assert not cache.contains("a")
+
+    disabled = NegativeCache(max_size=0, ttl_seconds=60)
+    disabled.add("a")
+    assert not disabled.contains("a")
+
+
+def test_record_malformed():
+    cache = NegativeCache(max_size=10, ttl_seconds=60)
+    cache.record_malformed()
+    assert cache.stats()["malformed"] == 1
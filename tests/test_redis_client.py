@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError, ResponseError, TimeoutError as RedisTimeoutError
+
+from src.cache import redis_client as redis_client_module
+from src.cache.exceptions import CacheTimeoutError, CacheUnavailableError
+from src.cache.redis_client import RedisCacheClient
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeRedis:
+    instances: list["FakeRedis"] = []
+
+    def __init__(self, connection_pool):
+        self.connection_pool = connection_pool
+        FakeRedis.instances.append(self)
+
+    async def ping(self):
+        await asyncio.sleep(0.01)
+        return True
+
+    async def aclose(self, close_connection_pool=None):
+        pass
+
+
+async def test_concurrent_connect_builds_a_single_pool(monkeypatch):
+    FakeRedis.instances = []
+    monkeypatch.setattr(redis_client_module, "Redis", FakeRedis)
+    monkeypatch.setattr(redis_client_module.BlockingConnectionPool, "from_url", lambda *args, **kwargs: object())
+    client = RedisCacheClient("redis://localhost:6379")
+
+    await asyncio.gather(*(client.connect() for _ in range(10)))
+
+    assert len(FakeRedis.instances) == 1
+    assert await client._get_client() is FakeRedis.instances[0]
+
+
+class StubRedis:
+    """Fails each command with the queued errors before succeeding."""
+
+    def __init__(self, *errors: Exception):
+        self.errors = list(errors)
+        self.calls: list[str] = []
+
+    async def _run(self, command: str, result):
+        self.calls.append(command)
+        if self.errors:
+            raise self.errors.pop(0)
+        return result
+
+    async def get(self, key):
+        return await self._run("get", '"value"')
+
+    async def set(self, key, value, ex=None):
+        return await self._run("set", True)
+
+    async def delete(self, key):
+        return await self._run("delete", 1)
+
+    async def getdel(self, key):
+        return await self._run("getdel", "value")
+
+
+@pytest.fixture
+def stub_client(monkeypatch):
+    monkeypatch.setattr(redis_client_module.redis_settings, "REDIS_RETRY_ATTEMPTS", 3)
+    monkeypatch.setattr(redis_client_module.redis_settings, "REDIS_RETRY_BACKOFF_BASE", 0)
+
+    def build(*errors: Exception) -> tuple[RedisCacheClient, StubRedis]:
+        client = RedisCacheClient("redis://localhost:6379")
+        stub = StubRedis(*errors)
+        client._client = stub
+        return client, stub
+    return build
+
+
+@pytest.mark.parametrize("error", [RedisConnectionError("down"), RedisTimeoutError("slow")])
+async def test_idempotent_operations_retry_transient_errors(stub_client, error):
+    client, stub = stub_client(error, error)
+
+    assert await client.get("key") == "value"
+    assert stub.calls == ["get"] * 3
+
+
+async def test_retries_stop_after_configured_attempts(stub_client):
+    client, stub = stub_client(*[RedisConnectionError("down")] * 5)
+
+    with pytest.raises(CacheUnavailableError) as exc_info:
+        await client.set("key", "value")
+
+    assert stub.calls == ["set"] * 3
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers["Retry-After"] == "1"
+
+
+async def test_timeouts_map_to_cache_timeout_error(stub_client):
+    client, stub = stub_client(*[RedisTimeoutError("slow")] * 3)
+
+    with pytest.raises(CacheTimeoutError) as exc_info:
+        await client.delete("key")
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers["Retry-After"] == "1"
+
+
+async def test_other_redis_errors_are_not_retried(stub_client):
+    client, stub = stub_client(ResponseError("WRONGTYPE"))
+
+    with pytest.raises(CacheUnavailableError) as exc_info:
+        await client.get("key")
+
+    assert not isinstance(exc_info.value, CacheTimeoutError)
+    assert stub.calls == ["get"]
+
+
+@pytest.mark.parametrize("error, expected", [
+    (RedisConnectionError("down"), CacheUnavailableError),
+    (RedisTimeoutError("slow"), CacheTimeoutError),
+])
+async def test_get_and_delete_is_attempted_once(stub_client, error, expected):
+    client, stub = stub_client(error)
+
+    with pytest.raises(expected):
+        await client.get_and_delete("key")
+
+    assert stub.calls == ["getdel"]
@@ -0,0 +1,62 @@
+import asyncio
+import re
+import time
+from collections import Counter
+
+import pytest
+
+from src.profiling.exceptions import ProfilerBusy
+from src.profiling.sampler import SamplingProfiler, to_collapsed
+
+pytestmark = pytest.mark.anyio
+
+COLLAPSED_LINE = re.compile(r"^\S.*\S \d+$")
+
+
+def busy_loop_step() -> int:
+    # Longer than the interpreter's 5 ms switch interval, so the sampler can take the GIL mid-burst.
+    deadline = time.perf_counter() + 0.02
+    total = 0
+    while time.perf_counter() < deadline:
+        total += 1
+    return total
+
+
+async def busy_worker(stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        busy_loop_step()
+        await asyncio.sleep(0)
+
+
+def test_to_collapsed_orders_by_count():
+    samples = Counter({"main (a.py:1);work (a.py:5)": 3, "main (a.py:1)": 7})
+
+    assert to_collapsed(samples) == "main (a.py:1) 7\nmain (a.py:1);work (a.py:5) 3"
+
+
+async def test_profile_samples_busy_coroutine():
+    stop = asyncio.Event()
+    worker = asyncio.create_task(busy_worker(stop))
+    try:
+        samples = await SamplingProfiler().profile(seconds=0.3, interval=0.005)
+    finally:
+        stop.set()
+        await worker
+
+    output = to_collapsed(samples)
+    lines = output.splitlines()
+    assert lines
+    assert all(COLLAPSED_LINE.match(line) for line in lines)
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == sum(samples.values())
+    assert any(stack.split(";")[-1].startswith("busy_loop_step") for stack in samples)
+
+
+async def test_profile_rejects_concurrent_runs():
+    profiler = SamplingProfiler()
+    first = asyncio.create_task(profiler.profile(seconds=0.05, interval=0.01))
+    await asyncio.sleep(0)
+
+    with pytest.raises(ProfilerBusy):
+        await profiler.profile(seconds=0.05, interval=0.01)
+    await first
+    assert not profiler.running
@@ -0,0 +1,48 @@
+import pytest
+
+from src.secrets.models import SecretLogModel
+from src.secrets.repository import SecretRepository
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_create_log_without_passphrase_maps_to_dto():
+    row = SecretLogModel(
+        id=1,
+        secret_key="4f9d1e5a-2b7c-4d3e-8f1a-6b2c9d0e7f13",
+        action="create",
+        ip_address="127.0.0.1",
+        ttl_seconds=3600,
+        passphrase_used=None,
+    )
+
+    dto = await SecretRepository(session=None)._get_dto(row)
+
+    assert dto.passphrase_used is None
+
+
+async def test_read_log_without_ttl_maps_to_dto():
+    row = SecretLogModel(
+        id=2,
+        secret_key="4f9d1e5a-2b7c-4d3e-8f1a-6b2c9d0e7f13",
+        action="read",
+        ip_address="127.0.0.1",
+        ttl_seconds=None,
+        passphrase_used=None,
+    )
+
+    dto = await SecretRepository(session=None)._get_dto(row)
+
+    assert dto.ttl_seconds is None
+
+
+async def test_get_create_log_returns_none_when_missing():
+    class EmptyResult:
+        def scalar_one_or_none(self):
+            return None
+
+    class Session:
+        async def execute(self, query):
+            return EmptyResult()
+
+    assert await SecretRepository(session=Session()).get_create_log("missing") is None
@@ -0,0 +1,72 @@
+from uuid import uuid4
+
+import pytest
+
+from src.cache.exceptions import CacheUnavailableError
+from src.secrets.dto import SecretCreateDTO, SecretDeleteDTO
+from src.secrets.exceptions import InvalidPassphrase, SecretNotFound
+
+pytestmark = pytest.mark.anyio
+
+IP_ADDRESS = "127.0.0.1"
+
+
+async def test_get_secret_returns_value_once(service):
+    secret = await service.create_secret(SecretCreateDTO(secret="hello"), IP_ADDRESS)
+
+    assert await service.get_secret(str(secret.key), IP_ADDRESS) == "hello"
+    with pytest.raises(SecretNotFound):
+        await service.get_secret(str(secret.key), IP_ADDRESS)
+
+
+async def test_delete_secret_without_passphrase(service, cache, repository):
+    secret = await service.create_secret(SecretCreateDTO(secret="hello"), IP_ADDRESS)
+
+    await service.delete_secret(str(secret.key), SecretDeleteDTO(), IP_ADDRESS)
+
+    assert await cache.get(str(secret.key)) is None
+    assert [log.action for log in repository.logs] == ["create", "delete"]
+    assert repository.logs[-1].passphrase_used is None
+
+
+async def test_delete_secret_with_wrong_passphrase(service):
+    secret = await service.create_secret(SecretCreateDTO(secret="hello", passphrase="right"), IP_ADDRESS)
+
+    with pytest.raises(InvalidPassphrase):
+        await service.delete_secret(str(secret.key), SecretDeleteDTO(passphrase="wrong"), IP_ADDRESS)
+
+
+async def test_malformed_key_rejected_without_cache_lookup(service, negative_cache, monkeypatch):
+    async def unexpected_lookup(key):
+        raise AssertionError("cache must not be queried")
+
+    monkeypatch.setattr(service.cache_client, "get_and_delete", unexpected_lookup)
+
+    with pytest.raises(SecretNotFound):
+        await service.get_secret("../../etc/passwd", IP_ADDRESS)
+    assert negative_cache.stats()["malformed"] == 1
+
+
+async def test_missing_key_is_served_from_negative_cache(service, cache, negative_cache):
+    key = str(uuid4())
+
+    for _ in range(3):
+        with pytest.raises(SecretNotFound):
+            await service.get_secret(key, IP_ADDRESS)
+
+    assert negative_cache.stats()["hits"] == 2
+
+
+async def test_cache_failure_does_not_poison_negative_cache(service, negative_cache, monkeypatch):
+    secret = await service.create_secret(SecretCreateDTO(secret="hello"), IP_ADDRESS)
+    real_get_and_delete = service.cache_client.get_and_delete
+
+    async def unavailable(key):
+        raise CacheUnavailableError()
+
+    monkeypatch.setattr(service.cache_client, "get_and_delete", unavailable)
+    with pytest.raises(CacheUnavailableError):
+        await service.get_secret(str(secret.key), IP_ADDRESS)
+
+    monkeypatch.setattr(service.cache_client, "get_and_delete", real_get_and_delete)
+    assert await service.get_secret(str(secret.key), IP_ADDRESS) == "hello"
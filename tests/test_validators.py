@@ -0,0 +1,22 @@
+from uuid import uuid4
+
+import pytest
+
+from src.secrets.validators import is_valid_secret_key
+
+
+def test_issued_keys_are_valid():
+    assert is_valid_secret_key(str(uuid4()))
+
+
+@pytest.mark.parametrize("secret_key", [
+    "",
+    "not-a-key",
+    "4F9D1E5A-2B7C-4D3E-8F1A-6B2C9D0E7F13",  # uppercase
+    "4f9d1e5a2b7c4d3e8f1a6b2c9d0e7f13",  # no hyphens
+    "4f9d1e5a-2b7c-1d3e-8f1a-6b2c9d0e7f13",  # version 1
+    "4f9d1e5a-2b7c-4d3e-cf1a-6b2c9d0e7f13",  # wrong variant
+    "4f9d1e5a-2b7c-4d3e-8f1a-6b2c9d0e7f13\n",
+])
+def test_malformed_keys_are_rejected(secret_key):
+    assert not is_valid_secret_key(secret_key)